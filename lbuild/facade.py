@@ -93,10 +93,10 @@ class BaseNodeInitFacade(BaseNodePrepareFacade):
         self._node._format_short_description = formatter
 
 
-class RepositoryInitFacade(BaseNodeInitFacade):
+class BaseNodeOptionFacade(BaseNodePrepareFacade):
 
-    def __init__(self, repository):
-        super().__init__(repository)
+    def __init__(self, node):
+        super().__init__(node)
 
     def add_option(self, option):
         self._node._options.append(option)
@@ -107,6 +107,12 @@ class RepositoryInitFacade(BaseNodeInitFacade):
     def add_list_option(self, option, default=None):
         self._node._options.append(OptionSet(option, default, unique=False))
 
+
+class RepositoryInitFacade(BaseNodeInitFacade, BaseNodeOptionFacade):
+
+    def __init__(self, repository):
+        super().__init__(repository)
+
     def add_query(self, query):
         self._node._queries.append(query)
 
@@ -146,7 +152,7 @@ class RepositoryPrepareFacade(BaseNodePrepareFacade):
         self.add_modules_recursive(basepath, modulefile, ignore)
 
 
-class ModulePrepareFacade(BaseNodePrepareFacade):
+class ModulePrepareFacade(BaseNodeOptionFacade):
 
     def __init__(self, module):
         super().__init__(module)
@@ -155,15 +161,6 @@ class ModulePrepareFacade(BaseNodePrepareFacade):
     def parent(self):
         return self._node.parent
 
-    def add_option(self, option):
-        self._node._options.append(option)
-
-    def add_set_option(self, option, default=None):
-        self._node._options.append(OptionSet(option, default))
-
-    def add_list_option(self, option, default=None):
-        self._node._options.append(OptionSet(option, default, unique=False))
-
     def add_query(self, query):
         self._node._queries.append(query)
 
@@ -12,6 +12,7 @@
 import os
 import logging
 import inspect
+import itertools
 
 import lbuild.utils
 import lbuild.format
@@ -70,7 +71,7 @@ def build_modules(initmodules):
 
     # then connect the entire tree
     for module in modules:
-        parent_name = ":".join(module.fullname.split(":")[:-1])
+        parent_name = module.fullname.rpartition(":")[0]
         parent = rmodules.get(parent_name) if ":" in parent_name else module._repository
         if parent:
             parent.add_child(module)
@@ -98,6 +99,7 @@ class ModuleInit:
 
         self.name = None
         self.parent = None
+        self._fullname = None
         self.context_parent = parent
         self.description = ""
         self.functions = {}
@@ -116,16 +118,18 @@ class ModuleInit:
 
     @property
     def fullname(self):
+        if self._fullname is not None:
+            return self._fullname
         if self.parent is None:
-            return "{}:{}".format(self.repository.name, self.name)
-        return "{}:{}".format(self.parent, self.name)
+            return self.repository.name + ":" + self.name
+        return self.parent + ":" + self.name
 
     def _clean(self, name):
         if name is None or not name: return ("", "");
-        if name.startswith("{}:".format(self.repository.name)):
+        if name.startswith(self.repository.name + ":"):
             name = name[len(self.repository.name):]
         if not name.startswith(":"):
-            name = ":{}".format(name)
+            name = ":" + name
         return name.rsplit(":", 1)
 
     def init(self):
@@ -147,6 +151,8 @@ class ModuleInit:
                                 parent_parent, parent_name, name_parent) if p)
 
         self.order = int(self.order)
+        # The name cannot change after init(), so compute the full name once
+        self._fullname = self.fullname
 
     def prepare(self):
         self.available = lbuild.utils.with_forward_exception(
@@ -203,7 +209,7 @@ class Module(BaseNode):
             self._filters[name] = func
 
         try:
-            for child in (module._options + module._queries + module._alias):
+            for child in itertools.chain(module._options, module._queries, module._alias):
                 self.add_child(child)
             for collector in module._collectors:
                 self.add_child(lbuild.collector.Collector(collector))
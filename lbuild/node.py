@@ -9,8 +9,10 @@
 # governing this code.
 
 import os
+import sys
 import enum
 import logging
+import functools
 import itertools
 
 import anytree
@@ -22,6 +24,34 @@ import lbuild.exception as le
 
 LOGGER = logging.getLogger('lbuild.node')
 
+@functools.lru_cache(maxsize=512)
+def _glob_query(query: str) -> str:
+    """
+    Convert a node query into an anytree glob query.
+
+    Empty name parts are replaced with `*` wildcards. The result only depends
+    on the query string and is therefore cached.
+    """
+    return ":".join(p if p else "*" for p in query.strip().split(":"))
+
+
+@functools.lru_cache(maxsize=4096)
+def _partial_name(query: str) -> tuple:
+    """
+    Split a node query into its name parts with `*` wildcards left empty.
+
+    The same dependency names are resolved over and over again, so the
+    result is cached.
+    """
+    return tuple("" if p == "*" else p for p in query.split(":"))
+
+
+@functools.lru_cache(maxsize=1024)
+def _relocate_path(basepath: str, path: str) -> str:
+    if not os.path.isabs(path):
+        path = os.path.join(basepath, path)
+    return os.path.normpath(path)
+
 
 def load_functions_from_file(repository, filename: str, required, optional=None, local=None):
     filename = os.path.realpath(filename)
@@ -108,15 +138,18 @@ class LocalFileReaderFactory:
 
 
 class NameResolver:
+    # Resolvers are created on every resolver property access
+    __slots__ = ("_node", "_type", "_returner", "_defaulter", "_selected")
 
-    def __init__(self, node, nodetype, selected=True, returner=None, defaulter=None):
+    def __init__(self, node: "BaseNode", nodetype: "BaseNode.Type", selected: bool = True,
+                 returner=None, defaulter=None):
         self._node = node
         self._type = nodetype
         self._returner = (lambda n: n) if returner is None else returner
         self._defaulter = (lambda n: n) if defaulter is None else defaulter
         self._selected = selected
 
-    def _get_node(self, key, check_dependencies=False, raise_on_fail=True):
+    def _get_node(self, key: str, check_dependencies: bool = False, raise_on_fail: bool = True):
         node = self._node._resolve_partial_max(key, max_results=1, raise_on_fail=raise_on_fail)
         if node is None: return None;
         node = node[0]
@@ -130,11 +163,12 @@ class NameResolver:
             warning = "Node '{}' has been moved to '{}'!\n\n{}\n\n".format(
                     le._hl(alias.fullname), le._hl(alias._destination), alias.description)
             try:
-                node = context_resolver._get_node(node._destination)
+                node = context_resolver._get_node(node._destination, raise_on_fail=raise_on_fail)
+                if node is None: return None;
                 warning += node.description + "\n"
-            except LbuildException as e:
+            except le.LbuildException:
                 LOGGER.warning(warning)
-                raise e
+                raise
             if alias._print_warning:
                 LOGGER.warning(warning)
                 alias._print_warning = False
@@ -153,11 +187,11 @@ class NameResolver:
                     "is of type '{}', but searching for '{}'!".format(
                             node._type.name.lower(), self._type.name.lower()))
 
-        if check_dependencies and node.type in {BaseNode.Type.OPTION, BaseNode.Type.QUERY, BaseNode.Type.COLLECTOR}:
+        if check_dependencies and node.type in _DEPENDENT_TYPES:
             if node.parent != self._node:
-                if all(n.type not in {BaseNode.Type.PARSER, BaseNode.Type.REPOSITORY} for n in {self._node, node.module}):
+                if all(n.type not in _INDEPENDENT_TYPES for n in (self._node, node.module)):
                     if node.parent not in self._node.dependencies:
-                        if self._selected or node.type not in {BaseNode.Type.COLLECTOR}:
+                        if self._selected or node.type != BaseNode.Type.COLLECTOR:
                             LOGGER.warning("Module '{}' accessing '{}' without depending on '{}'!"
                                            .format(self._node.fullname, node.fullname, node.module.fullname))
 
@@ -167,13 +201,13 @@ class NameResolver:
         node = self._get_node(key, check_dependencies=True, raise_on_fail=True)
         return self._returner(node)
 
-    def get(self, key, default=None):
+    def get(self, key: str, default=None):
         node = self._get_node(key, raise_on_fail=False)
         if node is not None:
             return self._returner(node)
         return self._defaulter(default)
 
-    def __contains__(self, key):
+    def __contains__(self, key: str) -> bool:
         return (self._get_node(key, raise_on_fail=False) is not None)
 
     def __len__(self):
@@ -200,6 +234,9 @@ class BaseNode(anytree.Node):
         ALIAS = 8
 
     def __init__(self, name, node_type, repository=None):
+        # Names are looked up over and over again by the resolvers
+        if type(name) is str:
+            name = sys.intern(name)
         anytree.Node.__init__(self, name)
 
         if self.separator in str(name):
@@ -213,6 +250,7 @@ class BaseNode(anytree.Node):
         self._functions = {}
 
         self._fullname = name
+        self._fullname_split = None
         self._filename = None
 
         # Dependency management
@@ -255,6 +293,14 @@ class BaseNode(anytree.Node):
             self._fullname = self.name
         return self._fullname
 
+    @property
+    def _fullname_parts(self):
+        # Cache the split full name until the full name is changed
+        fullname = self.fullname
+        if self._fullname_split is None or self._fullname_split[0] is not fullname:
+            self._fullname_split = (fullname, fullname.split(":"))
+        return self._fullname_split[1]
+
     @property
     def description_name(self):
         return self.fullname
@@ -353,8 +399,11 @@ class BaseNode(anytree.Node):
         return lbuild.format.format_node_tree(self, filterfunc)
 
     def add_dependencies(self, *dependencies):
-        self._dependency_module_names += dependencies
-        self._dependencies_resolved = False
+        for name in dependencies:
+            # Keep the declaration order, but skip repeated names
+            if name not in self._dependency_module_names:
+                self._dependency_module_names.append(name)
+                self._dependencies_resolved = False
 
     def add_child(self, node):
         for child in self.children:
@@ -363,7 +412,9 @@ class BaseNode(anytree.Node):
         node._repository = self._repository
         node.parent = self
         node.add_dependencies(self.fullname)
-        node._fullname = self.fullname + ":" + node.name
+        fullname = self.fullname + ":" + node.name
+        # sys.intern() rejects str subclasses
+        node._fullname = sys.intern(fullname) if type(fullname) is str else fullname
 
     def all_queries(self, depth=None, selected=True):
         return self._findall(self.Type.QUERY, depth, selected)
@@ -394,7 +445,7 @@ class BaseNode(anytree.Node):
             return
 
         dependencies = set()
-        for dependency_name in {n for n in self._dependency_module_names if ":" in n}:
+        for dependency_name in (n for n in self._dependency_module_names if ":" in n):
             dependency = self.module_resolver[dependency_name]
             dependencies.add(dependency)
 
@@ -418,8 +469,7 @@ class BaseNode(anytree.Node):
             return resolved1
 
         # no result or ambiguous? try to fill the partial name
-        query = ":".join(self._fill_partial_name(
-                            ["" if p == "*" else p for p in query.split(":")]))
+        query = ":".join(self._fill_partial_name(_partial_name(query)))
         resolved2 = self._resolve(query, [])
 
         if not (resolved2 or resolved1):
@@ -436,7 +486,7 @@ class BaseNode(anytree.Node):
     def _resolve(self, query, default):
         # :*   -> non-recursive
         # :**  -> recursive
-        query = ":".join(p if p else "*" for p in query.strip().split(":"))
+        query = _glob_query(query)
         try:
             qquery = ":" + query.replace(":**", "")
             if self.root._type == self.Type.PARSER:
@@ -459,11 +509,11 @@ class BaseNode(anytree.Node):
 
         Returns an array of the full name.
         """
-        module_fullname_parts = self.fullname.split(":")
+        module_fullname_parts = self._fullname_parts
 
         # if partial_name is just leaf name, set scope to local node
         if len(partial_name) == 1:
-            partial_name = module_fullname_parts + partial_name
+            partial_name = module_fullname_parts + list(partial_name)
         # Limit length of the module name to the length of the requested name
         depth = len(partial_name)
         if len(module_fullname_parts) > depth:
@@ -536,10 +586,13 @@ class BaseNode(anytree.Node):
         Relocate relative paths to the path of the repository
         configuration file.
         """
-        path = str(path)
-        if not os.path.isabs(path):
-            path = os.path.join(self._filepath, path)
-        return os.path.normpath(path)
+        return _relocate_path(self._filepath, str(path))
+
+
+# Node types whose access is checked against the module dependencies
+_DEPENDENT_TYPES = frozenset({BaseNode.Type.OPTION, BaseNode.Type.QUERY, BaseNode.Type.COLLECTOR})
+# Node types that may access anything without depending on it
+_INDEPENDENT_TYPES = frozenset({BaseNode.Type.PARSER, BaseNode.Type.REPOSITORY})
 
 
 class Alias(BaseNode):
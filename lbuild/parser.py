@@ -202,7 +202,7 @@ class Parser(BaseNode):
         Returns:
             list: Required modules for the given list of modules.
         """
-        selected_modules = set(requested_modules.copy())
+        selected_modules = set(requested_modules)
         LOGGER.info("Selected modules: %s",
                     ", ".join(sorted(module.fullname for module in selected_modules)))
 
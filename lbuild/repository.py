@@ -11,9 +11,9 @@
 
 import os
 import sys
-import glob
 import logging
 import fnmatch
+import itertools
 
 import lbuild.utils
 
@@ -107,7 +107,7 @@ class Repository(BaseNode):
             self._filters[name] = func
 
         try:
-            for child in (repo._options + repo._queries + repo._alias):
+            for child in itertools.chain(repo._options, repo._queries, repo._alias):
                 self.add_child(child)
             for (name, path, description) in repo._configurations:
                 path = self._relocate_relative_path(path)
@@ -118,9 +118,9 @@ class Repository(BaseNode):
         except le.LbuildNodeDuplicateChildException as error:
             raise le.LbuildRepositoryDuplicateChildException(repo._parser, repo, error)
 
-        # List of module filenames which are later transfered into
+        # Set of module filenames which are later transfered into
         # module objects
-        self._module_files = []
+        self._module_files = set()
         # List of programatically added modules
         self._submodules = []
 
@@ -136,7 +136,7 @@ class Repository(BaseNode):
 
         modules = []
         # Parse the module files inside this repository
-        for modulefile in self._module_files:
+        for modulefile in sorted(self._module_files):
             module = lbuild.module.load_module_from_file(repository=self,
                                                          filename=modulefile)
             modules.extend(module)
@@ -169,13 +169,24 @@ class Repository(BaseNode):
         ignore.append(os.path.relpath(self._filename, self._filepath))
         basepath = self._relocate_relative_path(basepath)
         found_one_module = False
-        for path, _, files in os.walk(basepath):
-            for file in files:
-                if any(fnmatch.fnmatch(file, i) for i in ignore):
+        # Depth-first search using the file type cached by os.scandir()
+        paths = [basepath]
+        while paths:
+            try:
+                entries = list(os.scandir(paths.pop()))
+            except OSError:
+                continue
+            for entry in entries:
+                if entry.is_dir():
+                    # Do not follow symlinks to directories, same as os.walk()
+                    if not entry.is_symlink():
+                        paths.append(entry.path)
                     continue
-                if fnmatch.fnmatch(file, modulefile):
-                    modulefilepath = os.path.normpath(os.path.join(path, file))
-                    self._module_files.append(modulefilepath)
+                if any(fnmatch.fnmatch(entry.name, i) for i in ignore):
+                    continue
+                if fnmatch.fnmatch(entry.name, modulefile):
+                    # basepath is already normalized, so is the entry path
+                    self._module_files.add(entry.path)
                     found_one_module = True
         if not found_one_module:
             raise le.LbuildRepositoryAddModuleRecursiveNotFoundException(self, basepath)
@@ -187,19 +198,30 @@ class Repository(BaseNode):
         Args:
             modules: List of filenames
         """
-        modules = [lbuild.utils.listify(m) for m in modules]
-        modules = [inner for outer in modules for inner in outer]
-        for module in modules:
+        for module in lbuild.utils.listify(*modules):
             if isinstance(module, str):
                 module = self._relocate_relative_path(module)
                 if not os.path.isfile(module):
                     raise le.LbuildRepositoryAddModuleNotFoundException(self, module)
-                self._module_files.append(module)
+                self._module_files.add(module)
             else:
                 self._submodules.append(module)
 
     def glob(self, pattern):
-        pattern = os.path.abspath(self._relocate_relative_path(pattern))
+        """
+        Find files matching a pattern relative to the repository file.
+
+        Args:
+            pattern: Shell-style pattern as used by the `glob` module.
+
+        Returns:
+            List of absolute file paths. This is part of the repository
+            facade API and is usually passed to `add_modules()`, which needs
+            a complete list anyway, so the result is not returned lazily.
+        """
+        import glob
+        # The repository path is absolute, no need for os.path.abspath()
+        pattern = self._relocate_relative_path(pattern)
         return glob.glob(pattern)
 
     def __repr__(self):
@@ -71,6 +71,8 @@ def ignore_patterns(*patterns):
 def _listify(obj):
     if obj is None:
         return list()
+    if isinstance(obj, str):
+        return [obj, ]
     if isinstance(obj, (list, tuple, set, range)):
         return list(obj)
     if hasattr(obj, "__iter__") and not hasattr(obj, "__getitem__"):
@@ -33,6 +33,7 @@ class DepedencyTest(unittest.TestCase):
         self.parser.prepare_repositories()
 
         module = self.parser.find_module(":module2")
+        self.assertEqual(1, module._dependency_module_names.count(":module1"))
 
         self.assertEqual(1, len(module.dependencies))
         self.assertEqual("repo:module1", module.dependencies[0].fullname)
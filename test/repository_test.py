@@ -60,6 +60,12 @@ class RepositoryTest(unittest.TestCase):
             repo = self.parser.parse_repository(self._get_path("no_module_recursive.lb"))
             repo.prepare()
 
+    def test_should_add_module_file_only_once(self):
+        repo = self.parser.parse_repository(self._get_path("duplicate_module/repo.lb"))
+        modules = repo.prepare()
+        self.assertEqual(1, len(modules))
+        self.assertEqual("duplicate_module:module", modules[0].fullname)
+
 
 if __name__ == '__main__':
     unittest.main()
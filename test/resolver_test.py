@@ -54,6 +54,7 @@ class ResolverTest(unittest.TestCase):
 
         self.module.add_child(Alias("alias_none", ""))
         self.module.add_child(Alias("alias_wrong", "::wrong"))
+        self.module.add_child(Alias("alias_unknown", "", destination="::unknown"))
 
 
     def test_should_resolve_module(self):
@@ -114,8 +115,21 @@ class ResolverTest(unittest.TestCase):
         with self.assertRaises(le.LbuildResolverAliasException):
             resolver["repo1:other:alias_wrong"]
 
+        with self.assertRaises(le.LbuildResolverNoMatchException):
+            resolver["repo1:other:alias_unknown"]
+        self.assertEqual("default", resolver.get("repo1:other:alias_unknown", "default"))
+        self.assertNotIn("repo1:other:alias_unknown", resolver)
+
         logging.disable(logging.NOTSET)
 
+    def test_should_cache_glob_queries(self):
+        self.assertEqual("*:other:*", lbuild.node._glob_query(":other:"))
+        self.assertEqual("repo1:*:foo", lbuild.node._glob_query(" repo1::foo "))
+
+        hits = lbuild.node._glob_query.cache_info().hits
+        self.assertEqual("repo1:*:foo", lbuild.node._glob_query(" repo1::foo "))
+        self.assertEqual(hits + 1, lbuild.node._glob_query.cache_info().hits)
+
 
 
 if __name__ == '__main__':